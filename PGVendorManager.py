@@ -1,43 +1,97 @@
 import tkinter as tk
-from tkinter import messagebox, Toplevel, Label, Entry, Button, Scrollbar, Canvas, OptionMenu, StringVar, simpledialog, Checkbutton, BooleanVar
+from tkinter import messagebox, Toplevel, Label, Entry, Button, Scrollbar, Canvas, StringVar, simpledialog, Checkbutton, BooleanVar, IntVar, ttk
+import atexit
 import json
+import logging
+import mmap
+import bisect
+import functools
+import hashlib
+import itertools
+import operator
 from datetime import datetime, timedelta
 import os
+import queue
+import re
 import sys
+import threading
+
+logger = logging.getLogger("pgvendor")
+
+try:
+    import orjson  # optional: much faster serialization when installed
+except ImportError:
+    orjson = None
 
 # ---------------------
 # Configuration
 # ---------------------
 # Use absolute path to avoid issues when running from different directories
 DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'character_data')
+LOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pgvendor.log')
 DEFAULT_CHARACTER = 'Default'
-MAX_TOTAL_MINUTES = 6 * 24 * 60 + 23 * 60 + 59  # 6d 23h 59m
+MINUTES_PER_DAY = 24 * 60
+MAX_TOTAL_MINUTES = 6 * MINUTES_PER_DAY + 23 * 60 + 59  # 6d 23h 59m
+SAVE_INTERVAL_MS = 2000
+MMAP_MIN_BYTES = 64 * 1024  # vendor files at least this big are parsed from a memory map (orjson only)
+TIMER_MAX_DELAY_MS = 60_000  # countdown labels change at most once a minute
+SHUTDOWN_SAVE_TIMEOUT = 2.0  # seconds on_closing waits for the saver before closing the window
+# Fixed category checkboxes; anything else a vendor has is shown in the Custom field
+CATEGORIES = ["Jewelry", "Armor", "Weapons", "Scrolls", "Misc"]
+_CATEGORY_SET = frozenset(CATEGORIES)
+CLUSTER_GAP = timedelta(hours=1)  # vendors resetting within this of each other share a cluster
+# Strips everything except str.isalnum() characters, space, '-' and '_' (\w covers alnum + '_')
+_UNSAFE_NAME_CHARS = re.compile(r'[^\w \-]+')
+# Dialog input validation (checked before converting instead of catching ValueError)
+_DECIMAL_RE = re.compile(r'\s*[-+]?(?:\d+(?:\.\d*)?|\.\d+)\s*')
+_INTEGER_RE = re.compile(r'\s*[-+]?\d+\s*')
+# Council values must fit in int64: orjson can't write larger ints and reads them back as floats
+MAX_COUNCIL = 2**63 - 1
 
 # ---------------------
 # Vendor model
 # ---------------------
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so load_vendors handles both
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode('ascii')
+    _loads = json.loads
+
+_fromisoformat = datetime.fromisoformat
+_by_next_reset = operator.attrgetter("next_reset")
+_WEEK = timedelta(days=7)
+
 class Vendor:
+    # council_left/reset_maximum/last_reset/categories are properties backed by the
+    # underscored slots; their setters drop the cached JSON
+    __slots__ = ("name", "zone", "_council_left", "_last_reset", "next_reset",
+                 "_reset_maximum", "_categories", "search_blob", "_json")
+
     def __init__(self, name, zone, council_left, last_reset, reset_maximum=0, categories=None):
+        self._json = None
         self.name = name
         self.zone = zone
         self.council_left = int(council_left)
         
-        # Improved last_reset parsing with better error handling
-        if isinstance(last_reset, str):
+        # Fast path: datetime passes through, ISO strings (what to_dict writes) parse directly
+        if isinstance(last_reset, datetime):
+            self.last_reset = last_reset
+        else:
             try:
-                self.last_reset = datetime.fromisoformat(last_reset)
+                self.last_reset = _fromisoformat(last_reset)
+            except TypeError:
+                logger.warning("Unknown last_reset type for %s, using current time", name)
+                self.last_reset = datetime.now()
             except ValueError:
                 try:
                     # fallback: if it's stored as timestamp string
                     self.last_reset = datetime.fromtimestamp(float(last_reset))
                 except (ValueError, OverflowError):
-                    print(f"Warning: Invalid last_reset format for {name}, using current time")
+                    logger.warning("Invalid last_reset format for %s, using current time", name)
                     self.last_reset = datetime.now()
-        elif isinstance(last_reset, datetime):
-            self.last_reset = last_reset
-        else:
-            print(f"Warning: Unknown last_reset type for {name}, using current time")
-            self.last_reset = datetime.now()
 
         self.reset_maximum = int(reset_maximum)
         self.categories = categories or []
@@ -52,20 +106,67 @@ class Vendor:
             "categories": self.categories
         }
 
+    def to_json_bytes(self):
+        """Compact JSON for this vendor, reused by save_vendors until a field changes."""
+        if self._json is None:
+            self._json = _dumps(self.to_dict())
+        return self._json
+
     @staticmethod
     def from_dict(d):
         return Vendor(
             d.get("name", ""),
             d.get("zone", ""),
             d.get("council_left", 0),
-            d.get("last_reset", datetime.now().isoformat()),
+            d.get("last_reset") or datetime.now(),
             d.get("reset_maximum", 0),
             d.get("categories", [])
         )
 
     @property
-    def next_reset(self):
-        return self.last_reset + timedelta(days=7)
+    def council_left(self):
+        return self._council_left
+
+    @council_left.setter
+    def council_left(self, value):
+        self._council_left = value
+        self._json = None
+
+    @property
+    def reset_maximum(self):
+        return self._reset_maximum
+
+    @reset_maximum.setter
+    def reset_maximum(self, value):
+        self._reset_maximum = value
+        self._json = None
+
+    @property
+    def last_reset(self):
+        return self._last_reset
+
+    @last_reset.setter
+    def last_reset(self, value):
+        # next_reset is read on every tick/sort/group, so keep it cached alongside last_reset
+        self._last_reset = value
+        self.next_reset = value + _WEEK
+        self._json = None
+
+    @property
+    def categories(self):
+        return self._categories
+
+    @categories.setter
+    def categories(self, value):
+        # name and zone are fixed after creation, so only categories need a rebuild.
+        # Categories are always reassigned, never mutated in place, so this also invalidates the JSON
+        self._categories = value
+        self._rebuild_search_blob()
+        self._json = None
+
+    def _rebuild_search_blob(self):
+        """Recompute the lowercased text the vendor filter matches against."""
+        self.search_blob = f"{self.name} {self.zone} {' '.join(self._categories)}".lower()
 
 
 # ---------------------
@@ -76,39 +177,58 @@ def _ensure_data_dir():
         if not os.path.exists(DATA_DIR):
             os.makedirs(DATA_DIR)
     except OSError as e:
-        print(f"Error creating data directory: {e}")
+        logger.exception("Error creating data directory")
         messagebox.showerror("Error", f"Could not create data directory: {e}")
 
+@functools.lru_cache(maxsize=64)
 def character_file_path(character_name):
     # Sanitize filename to prevent path issues
-    safe_name = "".join(c for c in character_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+    safe_name = _UNSAFE_NAME_CHARS.sub('', character_name).rstrip()
     return os.path.join(DATA_DIR, f"{safe_name}_vendors.json")
 
+def serialize_vendors(vendors):
+    """Vendor list as JSON bytes. Keep format as a list (backwards-compatible)."""
+    # Compact JSON list built from each vendor's cached encoding, so unchanged vendors aren't re-serialized
+    return b'[' + b','.join(v.to_json_bytes() for v in vendors) + b']'
+
+def write_vendor_file(payload, character_name):
+    """Write serialized vendors for character_name; raises OSError. Safe to call off the Tk thread."""
+    file_path = character_file_path(character_name)
+    # Written to a temp file and swapped in so a crash can't truncate the data
+    tmp_path = file_path + '.tmp'
+    try:
+        f = open(tmp_path, 'wb')
+    except FileNotFoundError:
+        # DATA_DIR is created at startup; only recreate it if it vanished since
+        os.makedirs(DATA_DIR, exist_ok=True)
+        f = open(tmp_path, 'wb')
+    with f:
+        f.write(payload)
+    os.replace(tmp_path, file_path)
+
 def save_vendors(vendors, character_name):
-    """Save vendors for character_name. Keep format as a list (backwards-compatible)."""
+    """Save vendors for character_name synchronously."""
     try:
-        _ensure_data_dir()
-        file_path = character_file_path(character_name)
-        vendor_list = [v.to_dict() for v in vendors]
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(vendor_list, f, indent=4, ensure_ascii=False)
+        write_vendor_file(serialize_vendors(vendors), character_name)
     except (OSError, IOError) as e:
-        print(f"Error saving vendors: {e}")
+        logger.exception("Error saving vendors")
         messagebox.showerror("Error", f"Could not save vendors: {e}")
 
 def load_vendors(character_name):
     """
     Load vendors for character_name with improved error handling.
     """
-    _ensure_data_dir()
     file_path = character_file_path(character_name)
-    
-    if not os.path.exists(file_path):
-        return []
-    
+
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Both loaders decode UTF-8 bytes themselves, skipping the text-mode wrapper
+        with open(file_path, 'rb') as f:
+            if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+                # orjson parses straight from the mapped pages, skipping the bytes copy
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    data = _loads(view)
+            else:
+                data = _loads(f.read())
             
         # if file is a list of dicts
         if isinstance(data, list):
@@ -116,8 +236,8 @@ def load_vendors(character_name):
             for vendor_data in data:
                 try:
                     vendors.append(Vendor.from_dict(vendor_data))
-                except Exception as e:
-                    print(f"Error loading vendor {vendor_data.get('name', 'Unknown')}: {e}")
+                except Exception:
+                    logger.exception("Error loading vendor %s", vendor_data.get('name', 'Unknown'))
             return vendors
             
         # if file is a dict with "vendors"
@@ -128,19 +248,22 @@ def load_vendors(character_name):
                 for vendor_data in vendors_blob:
                     try:
                         vendors.append(Vendor.from_dict(vendor_data))
-                    except Exception as e:
-                        print(f"Error loading vendor {vendor_data.get('name', 'Unknown')}: {e}")
+                    except Exception:
+                        logger.exception("Error loading vendor %s", vendor_data.get('name', 'Unknown'))
                 return vendors
         
-        print(f"Warning: Unexpected file format in {file_path}")
+        logger.warning("Unexpected file format in %s", file_path)
         return []
         
     except json.JSONDecodeError as e:
-        print(f"Error parsing JSON file {file_path}: {e}")
+        logger.exception("Error parsing JSON file %s", file_path)
         messagebox.showerror("Error", f"Could not parse vendor file for {character_name}: {e}")
         return []
+    except FileNotFoundError:
+        # No vendors saved for this character yet
+        return []
     except (OSError, IOError) as e:
-        print(f"Error reading file {file_path}: {e}")
+        logger.exception("Error reading file %s", file_path)
         messagebox.showerror("Error", f"Could not read vendor file for {character_name}: {e}")
         return []
 
@@ -149,11 +272,16 @@ def load_vendors(character_name):
 # Helpers
 # ---------------------
 def format_number(value):
-    try:
-        value = int(value)
-    except (ValueError, TypeError):
-        return str(value)
-    
+    if type(value) is not int:
+        try:
+            value = int(value)
+        except (ValueError, TypeError):
+            return str(value)
+    return _format_number_int(value)
+
+@functools.lru_cache(maxsize=4096)
+def _format_number_int(value):
+    # Vendors share a handful of council values, so most row renders are cache hits
     if value == 0:
         return "0"
     elif abs(value) >= 1_000_000:
@@ -163,6 +291,22 @@ def format_number(value):
     else:
         return str(value)
 
+def format_time_left(td):
+    """Format a time-until-reset timedelta as 'D days, Hh, Mm' using integer fields only."""
+    days = td.days
+    # timedelta normalizes seconds/microseconds to be non-negative, so only days carries the sign
+    if days < 0 or not (days or td.seconds or td.microseconds):
+        return "RESET PENDING!"
+    hours, rem = divmod(td.seconds, 3600)
+    return f"{days} days, {hours}h, {rem // 60}m"
+
+def _ms_until_minute_change(td):
+    """Milliseconds until format_time_left(td) would show a different value as td counts down."""
+    if td.days < 0:
+        return TIMER_MAX_DELAY_MS  # already RESET PENDING!, nothing left to count
+    return (td.seconds % 60) * 1000 + td.microseconds // 1000 + 1
+
+@functools.lru_cache(maxsize=256)
 def _clamp_reset_inputs(days, hours, minutes, override_max_time=False):
     """Clamp user inputs to reasonable bounds. If not override, clamp to <= 6d 23h 59m."""
     try:
@@ -173,10 +317,10 @@ def _clamp_reset_inputs(days, hours, minutes, override_max_time=False):
         return 0, 0, 0
 
     if not override_max_time:
-        total_minutes = d * 24 * 60 + h * 60 + m
+        total_minutes = d * MINUTES_PER_DAY + h * 60 + m
         if total_minutes > MAX_TOTAL_MINUTES:
             total_minutes = MAX_TOTAL_MINUTES
-        d, remainder = divmod(total_minutes, 24 * 60)
+        d, remainder = divmod(total_minutes, MINUTES_PER_DAY)
         h, m = divmod(remainder, 60)
     else:
         # still keep hours/minutes in normal ranges
@@ -190,16 +334,22 @@ def calculate_last_reset(days, hours, minutes, override_max_time=False):
     time_until_reset = timedelta(days=d, hours=h, minutes=m)
     if not override_max_time:
         # "time since last reset" = 7 days - time_until_reset
-        time_since_last_reset = timedelta(days=7) - time_until_reset
+        time_since_last_reset = _WEEK - time_until_reset
         return datetime.now() - time_since_last_reset
     else:
         # allow >7d and compute accordingly
-        return datetime.now() + time_until_reset - timedelta(days=7)
+        return datetime.now() + time_until_reset - _WEEK
 
 
 # ---------------------
 # GUI Application
 # ---------------------
+def _set_label_text(label, text):
+    """config(text=...) only when it differs from what the label already shows (tracked in label.shown_text)."""
+    if label.shown_text != text:
+        label.config(text=text)
+        label.shown_text = text
+
 class VendorApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -208,30 +358,58 @@ class VendorApp(tk.Tk):
 
         # Initialize vendors list
         self.vendors = []
+        # Vendor row widgets, reused across update_vendor_list calls
+        self._vendor_rows = {}
+        self._shown_rows = []
+        self._refresh_pending = False
+        self._last_query = None
+        # Update dialog, built on first use and reused afterwards
+        self._update_window = None
         
         # Load characters with error handling
         try:
             _ensure_data_dir()
-            files = [f for f in os.listdir(DATA_DIR) if f.endswith('_vendors.json')]
-            self.characters = sorted(list({f.replace('_vendors.json', '') for f in files}))
+            suffix = '_vendors.json'
+            with os.scandir(DATA_DIR) as entries:
+                self.characters = sorted({e.name[:-len(suffix)] for e in entries
+                                          if e.name.endswith(suffix) and e.is_file()})
         except OSError:
             self.characters = []
             
+        # self.characters stays sorted so new names can be placed with bisect.insort
         if DEFAULT_CHARACTER not in self.characters:
-            self.characters.insert(0, DEFAULT_CHARACTER)
-        if not self.characters:
-            self.characters = [DEFAULT_CHARACTER]
-        self.current_character = self.characters[0]
+            bisect.insort(self.characters, DEFAULT_CHARACTER)
+            self.current_character = DEFAULT_CHARACTER
+        else:
+            self.current_character = self.characters[0]
 
+        # self.vendors is kept ordered by next_reset, which is the display order
         self.vendors = load_vendors(self.current_character)
+        self.vendors.sort(key=_by_next_reset)
+
+        # Countdown timer state; the first vendor-list render starts the loop,
+        # and it pauses while the window is minimized
+        self.timer_running = True
+        self._visible = True
+        self._timer_after = None
 
         self.create_widgets()
         self.update_vendor_list()
         self.update_total_values()
-        
-        # Start timer updates
-        self.timer_running = True
-        self.after(1000, self.update_timers)
+
+        self.bind("<Map>", self._on_map)
+        self.bind("<Unmap>", self._on_unmap)
+
+        # Edits only mark the vendor list dirty; it is serialized periodically and on close,
+        # and a background thread does the disk write so the GUI never waits on I/O
+        self._save_dirty = False
+        self._save_queue = queue.Queue()
+        self._save_errors = queue.Queue()
+        self._queued_digests = {}
+        self._saver = threading.Thread(target=self._saver_loop, daemon=True)
+        self._saver.start()
+        atexit.register(self._save_at_exit)
+        self.after(SAVE_INTERVAL_MS, self._flush_if_dirty)
 
     def create_widgets(self):
         # Top: character selection and filter
@@ -241,24 +419,28 @@ class VendorApp(tk.Tk):
         Label(top, text="Character:").pack(side=tk.LEFT)
         self.char_var = StringVar(value=self.current_character)
         self.char_var.trace("w", self.on_char_change)
-        self.char_menu = OptionMenu(top, self.char_var, *self.characters)
+        self.char_menu = ttk.Combobox(top, textvariable=self.char_var, values=self.characters, state="readonly")
         self.char_menu.pack(side=tk.LEFT, padx=6)
 
         Button(top, text="Add New Character", command=self.add_new_character).pack(side=tk.LEFT, padx=6)
 
         Label(top, text="Filter:").pack(side=tk.LEFT, padx=(12,4))
         self.filter_var = StringVar()
-        self.filter_var.trace("w", lambda *a: self.update_vendor_list())
+        self._filter_after = None
+        self.filter_var.trace("w", self._on_filter_change)
         Entry(top, textvariable=self.filter_var).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=6)
 
         # Info bar
         info = tk.Frame(self, bg="lightgrey", relief="raised", bd=1)
         info.pack(fill=tk.X, padx=8, pady=6)
         self.total_council_label = Label(info, text="Current Vendor Council Pool: 0K", bg="lightgrey")
+        self.total_council_label.shown_text = None
         self.total_council_label.pack(side=tk.LEFT, padx=8, pady=6)
         self.total_max_label = Label(info, text="Total Vendor Cash: 0K", bg="lightgrey")
+        self.total_max_label.shown_text = None
         self.total_max_label.pack(side=tk.LEFT, padx=8, pady=6)
         self.next_reset_label = Label(info, text="Time until next reset: --", bg="lightgrey")
+        self.next_reset_label.shown_text = None
         self.next_reset_label.pack(side=tk.LEFT, padx=8, pady=6)
 
         # Buttons
@@ -266,6 +448,10 @@ class VendorApp(tk.Tk):
         btns.pack(fill=tk.X, padx=8, pady=4)
         Button(btns, text="Add New Vendor", command=self.open_add_vendor_window).pack(side=tk.LEFT, padx=4)
 
+        # Status bar for non-blocking confirmations (packed before the list so it keeps its space)
+        self.status_var = StringVar()
+        Label(self, textvariable=self.status_var, anchor="w", relief="sunken", bd=1).pack(side=tk.BOTTOM, fill=tk.X)
+
         # Vendor list with scrolling
         self.vendor_frame = tk.Frame(self)
         self.vendor_frame.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
@@ -285,33 +471,142 @@ class VendorApp(tk.Tk):
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
 
-        # Improved mouse wheel binding for cross-platform compatibility
-        def _on_mousewheel(event):
+        # Bind for different platforms
+        self.canvas.bind_all("<MouseWheel>", self._on_wheel_win)   # Windows
+        self.canvas.bind_all("<Button-4>", self._on_wheel_up)      # Linux
+        self.canvas.bind_all("<Button-5>", self._on_wheel_down)    # Linux
+
+    # Mouse wheel handlers, one per event so no per-event platform checks are needed
+    def _on_wheel_win(self, event):
+        self.canvas.yview_scroll(int(-event.delta / 120), "units")
+
+    def _on_wheel_up(self, event):
+        self.canvas.yview_scroll(-1, "units")
+
+    def _on_wheel_down(self, event):
+        self.canvas.yview_scroll(1, "units")
+
+    def _on_filter_change(self, *args):
+        # Debounce: rebuild the list once typing pauses instead of on every keystroke
+        if self._filter_after:
+            self.after_cancel(self._filter_after)
+        self._filter_after = self.after(150, self._apply_filter)
+
+    def _apply_filter(self):
+        self._filter_after = None
+        # Edits that cancel out while the timer was pending (e.g. type + backspace) need no redraw
+        if self.filter_var.get().lower().strip() != self._last_query:
+            self.update_vendor_list()
+
+    def report_callback_exception(self, exc, val, tb):
+        # Unexpected errors from any Tk callback: keep the traceback in the log and tell the user
+        logger.error("Unhandled error in Tk callback", exc_info=(exc, val, tb))
+        messagebox.showerror("Error", f"Unexpected error: {val}", parent=self)
+
+    def _place_vendor(self, vendor):
+        """Insert vendor into self.vendors at its next_reset position."""
+        bisect.insort(self.vendors, vendor, key=_by_next_reset)
+
+    def _reposition_vendor(self, vendor):
+        """Move vendor to its new spot after its last_reset changed."""
+        self.vendors.remove(vendor)
+        self._place_vendor(vendor)
+
+    def _mark_dirty(self):
+        self._save_dirty = True
+
+    def _saver_loop(self):
+        """Background writer: (payload, character) jobs in order; None stops the thread."""
+        while True:
+            job = self._save_queue.get()
             try:
-                # Windows
-                if hasattr(event, 'delta'):
-                    self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-                # Linux
-                elif event.num == 4:
-                    self.canvas.yview_scroll(-1, "units")
-                elif event.num == 5:
-                    self.canvas.yview_scroll(1, "units")
+                if job is None:
+                    return
+                write_vendor_file(*job)
             except Exception as e:
-                print(f"Mouse wheel error: {e}")
-        
-        # Bind for different platforms
-        self.canvas.bind_all("<MouseWheel>", _on_mousewheel)  # Windows
-        self.canvas.bind_all("<Button-4>", _on_mousewheel)    # Linux
-        self.canvas.bind_all("<Button-5>", _on_mousewheel)    # Linux
+                # Any failure is reported (Tk isn't thread-safe, so from the main thread)
+                # and the worker keeps running; a dead worker would leave jobs unconsumed
+                self._save_errors.put(e)
+            finally:
+                # Lets _wait_for_saves block on _save_queue.join()
+                self._save_queue.task_done()
+
+    def _queue_save(self):
+        # Serialize on the Tk thread so the worker never touches live Vendor objects
+        payload = serialize_vendors(self.vendors)
+        # Skip the write when it would reproduce the last payload queued for this character
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        if self._queued_digests.get(self.current_character) == digest:
+            return
+        self._queued_digests[self.current_character] = digest
+        self._save_queue.put((payload, self.current_character))
+
+    def _save_at_exit(self):
+        """atexit hook: queue anything still unsaved (on_closing didn't run) and let the worker finish."""
+        if self._saver.is_alive():
+            for e in self._take_save_errors():
+                logger.error("Error saving vendors: %s", e)
+            if self._save_dirty:
+                self._save_dirty = False
+                self._queue_save()
+            self._save_queue.put(None)
+            self._saver.join()
+        for e in self._take_save_errors():
+            logger.error("Error saving vendors: %s", e)
+
+    def _take_save_errors(self):
+        """Drain failed-write errors; any failure forgets the digests and marks the vendors for a retry."""
+        errors = []
+        while not self._save_errors.empty():
+            errors.append(self._save_errors.get_nowait())
+        if errors:
+            # The file may not match any remembered digest, so the next save must not be skipped
+            self._queued_digests.clear()
+            self._save_dirty = True
+        return errors
+
+    def _report_save_errors(self):
+        # Call before _queue_save so a stale digest can't swallow the retry
+        for e in self._take_save_errors():
+            logger.error("Error saving vendors: %s", e)
+            messagebox.showerror("Error", f"Could not save vendors: {e}")
+
+    def _flush_save(self):
+        """Queue a write of the current character's vendors if anything changed since the last one."""
+        if self._save_dirty:
+            self._queue_save()
+            # Cleared only once queued, so a serialization error leaves the edits pending
+            self._save_dirty = False
+
+    def _wait_for_saves(self):
+        """Flush pending edits and block until every queued write is on disk, so a load reads fresh data."""
+        self._report_save_errors()
+        self._flush_save()
+        # Without a live worker nothing would ever drain the queue
+        if self._saver.is_alive():
+            self._save_queue.join()
+        self._report_save_errors()
+
+    def _flush_if_dirty(self):
+        try:
+            self._report_save_errors()
+            self._flush_save()
+        finally:
+            # Re-arm even if serializing failed, or periodic saving would stop for good
+            self.after(SAVE_INTERVAL_MS, self._flush_if_dirty)
 
     def on_char_change(self, *args):
         try:
+            # Pending edits belong to the character being switched away from; wait for them
+            # (and any earlier writes) so switching back doesn't reload a stale file
+            self._wait_for_saves()
             self.current_character = self.char_var.get()
             self.vendors = load_vendors(self.current_character)
-            self.update_vendor_list()
-            self.update_total_values()
+            self.vendors.sort(key=_by_next_reset)
+            self._hide_stale_update_window()
+            self._schedule_refresh()
         except Exception as e:
-            print(f"Error changing character: {e}")
+            logger.exception("Error changing character")
             messagebox.showerror("Error", f"Could not switch to character: {e}")
 
     def add_new_character(self):
@@ -323,7 +618,7 @@ class VendorApp(tk.Tk):
             return
         
         # More flexible character name validation
-        safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
+        safe_name = _UNSAFE_NAME_CHARS.sub('', name).strip()
         if not safe_name:
             messagebox.showerror("Error", "Character name must contain alphanumeric characters.", parent=self)
             return
@@ -332,114 +627,196 @@ class VendorApp(tk.Tk):
             messagebox.showerror("Error", "Character already exists.", parent=self)
             return
             
-        self.characters.append(safe_name)
-        self.characters.sort()
+        bisect.insort(self.characters, safe_name)
         self.char_var.set(safe_name)
         self.update_char_menu()
         
         # If Default existed, copy default vendors into new char
         default_path = character_file_path(DEFAULT_CHARACTER)
+        # Default may still have a write queued; the copy must see it
+        self._wait_for_saves()
         if os.path.exists(default_path):
             try:
                 default_vendors = load_vendors(DEFAULT_CHARACTER)
                 save_vendors(default_vendors, safe_name)
-            except Exception as e:
-                print(f"Error copying default vendors: {e}")
+            except Exception:
+                logger.exception("Error copying default vendors")
 
     def update_char_menu(self):
         try:
-            menu = self.char_menu["menu"]
-            menu.delete(0, "end")
-            for c in sorted(self.characters):
-                menu.add_command(label=c, command=tk._setit(self.char_var, c))
-        except Exception as e:
-            print(f"Error updating character menu: {e}")
+            self.char_menu.configure(values=self.characters)
+        except Exception:
+            logger.exception("Error updating character menu")
+
+    def _schedule_refresh(self):
+        """Redraw the list and totals once the current event is handled, however many changes it made."""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = False
+        self.update_vendor_list()
+        self.update_total_values()
+
+    def set_status(self, message):
+        self.status_var.set(f"{message} ({datetime.now():%H:%M:%S})")
 
     def update_total_values(self):
         try:
             total_council = sum(v.council_left for v in self.vendors)
             total_maximum = sum(v.reset_maximum for v in self.vendors)
-            self.total_council_label.config(text=f"Current Vendor Council Pool: {format_number(total_council)}")
-            self.total_max_label.config(text=f"Total Vendor Cash: {format_number(total_maximum)}")
-        except Exception as e:
-            print(f"Error updating total values: {e}")
+            # Most edits leave at least one total unchanged; skip those Tk re-layouts
+            _set_label_text(self.total_council_label, "Current Vendor Council Pool: " + format_number(total_council))
+            _set_label_text(self.total_max_label, "Total Vendor Cash: " + format_number(total_maximum))
+        except Exception:
+            logger.exception("Error updating total values")
+
+    def _on_map(self, event):
+        # Child widgets (e.g. pack_forget rows) also report Map/Unmap through the root binding
+        if event.widget is self and not self._visible:
+            self._visible = True
+            self._restart_timers()
+
+    def _on_unmap(self, event):
+        if event.widget is self:
+            self._visible = False
+
+    def _restart_timers(self):
+        """Refresh the countdowns now instead of waiting for the next scheduled tick."""
+        if self._timer_after is not None:
+            self.after_cancel(self._timer_after)
+            self._timer_after = None
+        self.update_timers()
 
     def update_timers(self):
-        if not self.timer_running:
+        # While hidden the loop stops; _on_map restarts it with an immediate refresh
+        if not self.timer_running or not self._visible:
             return
-            
+
+        # Countdowns only show whole minutes, so sleep until the next one changes
+        delay = TIMER_MAX_DELAY_MS
         try:
-            # Update each vendor's time label if present
-            for widget in self.scrollable_frame.winfo_children():
-                if hasattr(widget, 'vendor_name') and hasattr(widget, 'time_label'):
-                    vname = widget.vendor_name
-                    vendor = next((x for x in self.vendors if x.name == vname), None)
-                    if vendor and widget.time_label.winfo_exists():
-                        time_diff = vendor.next_reset - datetime.now()
-                        if time_diff.total_seconds() > 0:
-                            days = time_diff.days
-                            hours = time_diff.seconds // 3600
-                            minutes = (time_diff.seconds % 3600) // 60
-                            time_str = f"{days} days, {hours}h, {minutes}m"
-                        else:
-                            time_str = "RESET PENDING!"
-                        widget.time_label.config(text=f"Time until reset: {time_str}")
+            now = datetime.now()
+
+            # Update the time label of each shown vendor row
+            prefix = "Time until reset: "
+            for row in self._shown_rows:
+                td = row.vendor_ref.next_reset - now
+                _set_label_text(row.time_label, prefix + format_time_left(td))
+                delay = min(delay, _ms_until_minute_change(td))
 
             # Global next reset
+            # self.vendors is ordered by next_reset, so the soonest reset is first
             if self.vendors:
-                next_reset = min(v.next_reset for v in self.vendors)
-                td = next_reset - datetime.now()
-                if td.total_seconds() > 0:
-                    days = td.days
-                    hours = td.seconds // 3600
-                    minutes = (td.seconds % 3600) // 60
-                    reset_str = f"{days} days, {hours}h, {minutes}m"
-                else:
-                    reset_str = "RESET PENDING!"
-                self.next_reset_label.config(text=f"Time until next reset: {reset_str}")
+                td = self.vendors[0].next_reset - now
+                _set_label_text(self.next_reset_label, "Time until next reset: " + format_time_left(td))
+                delay = min(delay, _ms_until_minute_change(td))
             else:
-                self.next_reset_label.config(text="Time until next reset: --")
-                
-        except Exception as e:
-            print(f"Error updating timers: {e}")
-        
+                _set_label_text(self.next_reset_label, "Time until next reset: --")
+
+        except Exception:
+            logger.exception("Error updating timers")
+            delay = 1000
+
         # Schedule next update
-        self.after(1000, self.update_timers)
+        self._timer_after = self.after(delay, self.update_timers)
 
     def _group_vendors_by_reset_time(self, vendors):
         if not vendors:
             return []
         clusters = []
         current = [vendors[0]]
-        THRESH = timedelta(hours=1)
-        for i in range(1, len(vendors)):
-            td = vendors[i].next_reset - vendors[i-1].next_reset
-            if td > THRESH:
+        prev = vendors[0].next_reset
+        # Single pass: each vendor's next_reset is read once and compared with the previous one
+        for vendor in vendors[1:]:
+            next_reset = vendor.next_reset
+            if next_reset - prev > CLUSTER_GAP:
                 clusters.append(current)
-                current = [vendors[i]]
+                current = [vendor]
             else:
-                current.append(vendors[i])
-        if current:
-            clusters.append(current)
+                current.append(vendor)
+            prev = next_reset
+        clusters.append(current)
         return clusters
 
+    def _build_vendor_row(self, vendor):
+        """Create the widgets for one vendor row; contents are filled in by _refresh_vendor_row."""
+        parent = tk.Frame(self.scrollable_frame)
+        # A row belongs to one Vendor object for its whole life (see update_vendor_list)
+        parent.vendor_ref = vendor
+
+        vf = tk.Frame(parent, bd=2, relief="groove", padx=5, pady=5)
+        vf.pack(fill=tk.X, expand=True)
+
+        info = tk.Frame(vf)
+        info.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        title_label = Label(info, text=f"{vendor.name} ({vendor.zone})", font=("Helvetica", 12, "bold"))
+        title_label.pack(anchor="w")
+        parent.council_label = Label(info)
+        parent.council_label.pack(anchor="w")
+        # Packed on demand by _refresh_vendor_row
+        parent.max_label = Label(info)
+        parent.cats_label = Label(info)
+
+        # Attach time_label to parent so update_timers can find it
+        parent.time_label = Label(info, text="", fg="red")
+        parent.time_label.pack(anchor="w")
+
+        btns = tk.Frame(vf)
+        btns.pack(side=tk.RIGHT)
+        # Built once per pooled row, so these partials live as long as the row does
+        Button(btns, text="Update", command=functools.partial(self.open_update_vendor_window, vendor)).pack(padx=5, pady=2)
+        Button(btns, text="Delete", command=functools.partial(self.delete_vendor, vendor)).pack(padx=5, pady=2)
+
+        parent.bg_widgets = (vf, info, btns, title_label, parent.council_label,
+                             parent.max_label, parent.cats_label, parent.time_label)
+        for label in (parent.council_label, parent.max_label, parent.cats_label, parent.time_label):
+            label.shown_text = None
+        parent.bg = None
+        parent.border_color = ""
+        parent.optional_shown = (False, False)
+        return parent
+
+    def _refresh_vendor_row(self, row, vendor, bg, border_color):
+        """Reconfigure an existing row in place instead of rebuilding it."""
+        if row.border_color != border_color:
+            row.config(bg=border_color or "", bd=5 if border_color else 0)
+            row.border_color = border_color
+        if row.bg != bg:
+            for w in row.bg_widgets:
+                w.config(bg=bg)
+            row.bg = bg
+
+        _set_label_text(row.council_label, "Council left: " + format_number(vendor.council_left))
+        show_max = vendor.reset_maximum > 0
+        show_cats = bool(vendor.categories)
+        if show_max:
+            _set_label_text(row.max_label, "Reset maximum: " + format_number(vendor.reset_maximum))
+        if show_cats:
+            _set_label_text(row.cats_label, "Categories: " + ", ".join(vendor.categories))
+
+        # Keep max/categories above the time label when they appear or disappear
+        if row.optional_shown != (show_max, show_cats):
+            row.max_label.pack_forget()
+            row.cats_label.pack_forget()
+            if show_max:
+                row.max_label.pack(anchor="w", before=row.time_label)
+            if show_cats:
+                row.cats_label.pack(anchor="w", before=row.time_label)
+            row.optional_shown = (show_max, show_cats)
+
     def update_vendor_list(self):
         try:
-            # Clear existing widgets
-            for w in self.scrollable_frame.winfo_children():
-                w.destroy()
-
-            query = self.filter_var.get().lower().strip()
-            filtered = []
-            for v in self.vendors:
-                blob = f"{v.name} {v.zone} {' '.join(v.categories)}".lower()
-                if query in blob:
-                    filtered.append(v)
-
-            sorted_vendors = sorted(filtered, key=lambda x: x.next_reset)
-            clusters = self._group_vendors_by_reset_time(sorted_vendors)
+            query = self._last_query = self.filter_var.get().lower().strip()
+            # self.vendors is already in next_reset order, so filtering keeps it sorted
+            filtered = [v for v in self.vendors if query in v.search_blob]
+            clusters = self._group_vendors_by_reset_time(filtered)
             total_clusters = len(clusters)
 
+            now = datetime.now()
+            shown = []
             for i, cluster in enumerate(clusters):
                 border_color = None
                 if total_clusters >= 3:
@@ -449,53 +826,54 @@ class VendorApp(tk.Tk):
                         border_color = "#8B0000"
 
                 for vendor in cluster:
-                    bg = "SystemButtonFace"
+                    # Plain datetime compare against the snapshot; no timedelta per row
                     if vendor.council_left == 0:
                         bg = "#D3D3D3"
-                    elif (vendor.next_reset - datetime.now()).total_seconds() <= 0:
+                    elif vendor.next_reset <= now:
                         bg = "#90EE90"
-
-                    parent = tk.Frame(self.scrollable_frame, bg=border_color or "", bd=5 if border_color else 0)
-                    parent.pack(fill=tk.X, pady=5)
-                    parent.vendor_name = vendor.name
-
-                    vf = tk.Frame(parent, bd=2, relief="groove", padx=5, pady=5, bg=bg)
-                    vf.pack(fill=tk.X, expand=True)
-
-                    info = tk.Frame(vf, bg=bg)
-                    info.pack(side=tk.LEFT, fill=tk.X, expand=True)
-
-                    Label(info, text=f"{vendor.name} ({vendor.zone})", font=("Helvetica", 12, "bold"), bg=bg).pack(anchor="w")
-                    Label(info, text=f"Council left: {format_number(vendor.council_left)}", bg=bg).pack(anchor="w")
-                    if vendor.reset_maximum > 0:
-                        Label(info, text=f"Reset maximum: {format_number(vendor.reset_maximum)}", bg=bg).pack(anchor="w")
-                    if vendor.categories:
-                        Label(info, text="Categories: " + ", ".join(vendor.categories), bg=bg).pack(anchor="w")
-
-                    time_label = Label(info, text="", fg="red", bg=bg)
-                    time_label.pack(anchor="w")
-
-                    # Attach time_label to parent so update_timers can find it
-                    parent.time_label = time_label
-
-                    btns = tk.Frame(vf, bg=bg)
-                    btns.pack(side=tk.RIGHT)
-                    Button(btns, text="Update", command=lambda v=vendor: self.open_update_vendor_window(v)).pack(padx=5, pady=2)
-                    Button(btns, text="Delete", command=lambda v=vendor: self.delete_vendor(v)).pack(padx=5, pady=2)
+                    else:
+                        bg = "SystemButtonFace"
+
+                    # Rows are pooled per vendor object and only created the first time it is shown
+                    row = self._vendor_rows.get(vendor)
+                    if row is None:
+                        row = self._vendor_rows[vendor] = self._build_vendor_row(vendor)
+                    self._refresh_vendor_row(row, vendor, bg, border_color)
+                    shown.append(row)
+
+            # Re-pack only from the first position where the visible order changed;
+            # rows above it keep their pack slots untouched
+            old_rows = self._shown_rows
+            if shown != old_rows:
+                k = next((i for i, (a, b) in enumerate(zip(shown, old_rows)) if a is not b),
+                         min(len(shown), len(old_rows)))
+                for row in old_rows[k:]:
+                    row.pack_forget()
+                for row in shown[k:]:
+                    row.pack(fill=tk.X, pady=5)
+                self._shown_rows = shown
+
+            # Destroy rows whose vendor was deleted or belongs to another character
+            live = set(self.vendors)
+            for vendor in [v for v in self._vendor_rows if v not in live]:
+                self._vendor_rows.pop(vendor).destroy()
         except Exception as e:
-            print(f"Error updating vendor list: {e}")
+            logger.exception("Error updating vendor list")
             messagebox.showerror("Error", f"Could not update vendor list: {e}")
 
+        # Rows may have been added or re-bound; show their countdowns right away
+        self._restart_timers()
+
     def delete_vendor(self, vendor_to_delete):
         try:
             if messagebox.askyesno("Delete Vendor", f"Are you sure you want to delete {vendor_to_delete.name}?", parent=self):
                 self.vendors = [v for v in self.vendors if v.name != vendor_to_delete.name]
-                save_vendors(self.vendors, self.current_character)
-                self.update_vendor_list()
-                self.update_total_values()
-                messagebox.showinfo("Deleted", f"{vendor_to_delete.name} has been deleted.", parent=self)
+                self._hide_stale_update_window()
+                self._mark_dirty()
+                self._schedule_refresh()
+                self.set_status(f"{vendor_to_delete.name} has been deleted.")
         except Exception as e:
-            print(f"Error deleting vendor: {e}")
+            logger.exception("Error deleting vendor")
             messagebox.showerror("Error", f"Could not delete vendor: {e}")
 
     # ---------------------
@@ -549,9 +927,8 @@ class VendorApp(tk.Tk):
         cat_frame = tk.Frame(cat_area_frame)
         cat_frame.pack(anchor="w", pady=2)
 
-        categories = ["Jewelry", "Armor", "Weapons", "Scrolls", "Misc"]
-        cat_vars = {c: BooleanVar() for c in categories}
-        for i, c in enumerate(categories):
+        cat_vars = {c: IntVar() for c in CATEGORIES}
+        for i, c in enumerate(CATEGORIES):
             r, col = divmod(i, 3)
             cb = Checkbutton(cat_frame, text=c, variable=cat_vars[c])
             cb.grid(row=r, column=col, sticky="w", padx=8, pady=4)
@@ -576,24 +953,25 @@ class VendorApp(tk.Tk):
                 if not name:
                     messagebox.showerror("Error", "Vendor name cannot be empty.", parent=add_window)
                     return
-                try:
-                    council_input = float(council_entry.get() or 0)
-                    council = int(council_input * 1000)
-                except (ValueError, TypeError):
+                council_text = council_entry.get() or "0"
+                if not _DECIMAL_RE.fullmatch(council_text):
                     messagebox.showerror("Error", "Council must be numeric (K).", parent=add_window)
                     return
+                council_value = float(council_text) * 1000
+                if abs(council_value) > MAX_COUNCIL:
+                    messagebox.showerror("Error", "Council value is too large.", parent=add_window)
+                    return
+                council = int(council_value)
 
                 # Raw time values
-                try:
-                    d_raw = int(days_entry.get() or 0)
-                    h_raw = int(hours_entry.get() or 0)
-                    m_raw = int(minutes_entry.get() or 0)
-                except (ValueError, TypeError):
+                time_texts = [e.get() or "0" for e in (days_entry, hours_entry, minutes_entry)]
+                if not all(_INTEGER_RE.fullmatch(t) for t in time_texts):
                     messagebox.showerror("Error", "Days, Hours, Minutes must be integers.", parent=add_window)
                     return
+                d_raw, h_raw, m_raw = map(int, time_texts)
 
                 override_flag = max_time_override_var.get()
-                total_minutes = d_raw * 24 * 60 + h_raw * 60 + m_raw
+                total_minutes = d_raw * MINUTES_PER_DAY + h_raw * 60 + m_raw
                 if total_minutes > MAX_TOTAL_MINUTES and not override_flag:
                     messagebox.showerror("Error", "Reset time cannot exceed 6d 23h 59m unless Max-Time-Override is checked.", parent=add_window)
                     return
@@ -602,29 +980,24 @@ class VendorApp(tk.Tk):
                 last_reset = calculate_last_reset(d, h, m, override_flag)
                 reset_maximum = council
 
-                selected_cats = [c for c, var in cat_vars.items() if var.get()]
+                get = IntVar.get  # unbound lookup hoisted out of the per-checkbox loop
+                selected_cats = [c for c, var in cat_vars.items() if get(var)]
                 if custom_var.get():
                     cv = custom_entry.get().strip()
                     if cv:
                         selected_cats.append(cv)
 
                 # Dedupe preserve order
-                seen = set()
-                final_cats = []
-                for c in selected_cats:
-                    if c not in seen:
-                        seen.add(c)
-                        final_cats.append(c)
+                final_cats = list(dict.fromkeys(selected_cats))
 
                 new_vendor = Vendor(name, zone, council, last_reset, reset_maximum, final_cats)
-                self.vendors.append(new_vendor)
-                save_vendors(self.vendors, self.current_character)
-                self.update_vendor_list()
-                self.update_total_values()
-                messagebox.showinfo("Success", f"Vendor '{name}' added.", parent=add_window)
+                self._place_vendor(new_vendor)
+                self._mark_dirty()
+                self._schedule_refresh()
+                self.set_status(f"Vendor '{name}' added.")
                 add_window.destroy()
             except Exception as e:
-                print(f"Error adding vendor: {e}")
+                logger.exception("Error adding vendor")
                 messagebox.showerror("Error", f"Could not add vendor: {e}", parent=add_window)
 
         add_button = Button(button_line, text="Add", command=add_and_save)
@@ -636,41 +1009,44 @@ class VendorApp(tk.Tk):
     # Update Vendor Window
     # ---------------------
     def open_update_vendor_window(self, vendor):
+        # The dialog is built once and reused; reopening only loads the new vendor into it
+        update_window = self._update_window
+        if update_window is None or not update_window.winfo_exists():
+            update_window = self._update_window = self._build_update_window()
+        self._load_update_window(vendor)
+        update_window.deiconify()
+        update_window.lift()
+
+    def _hide_stale_update_window(self):
+        """Withdraw the update dialog if its vendor was deleted or belongs to another character."""
+        update_window = self._update_window
+        if update_window is not None and update_window.vendor not in self.vendors:
+            update_window.withdraw()
+
+    def _build_update_window(self):
         update_window = Toplevel(self)
-        update_window.title(f"Update {vendor.name}")
         update_window.geometry("640x360")
+        # Closing just hides the window so the next open can reuse it
+        update_window.protocol("WM_DELETE_WINDOW", update_window.withdraw)
 
-        Label(update_window, text=f"Updating {vendor.name} ({vendor.zone})").pack(padx=10, pady=(8,2), anchor="w")
+        update_window.header_label = Label(update_window)
+        update_window.header_label.pack(padx=10, pady=(8,2), anchor="w")
 
         Label(update_window, text="New Council left (in K):").pack(padx=10, anchor="w")
         council_entry = Entry(update_window)
-        council_entry.insert(0, str(vendor.council_left // 1000))
         council_entry.pack(padx=10, fill=tk.X)
 
-        # Prefill time until next reset
-        try:
-            time_diff = vendor.next_reset - datetime.now()
-            init_days = max(0, time_diff.days)
-            init_hours = max(0, time_diff.seconds // 3600)
-            init_minutes = max(0, (time_diff.seconds % 3600) // 60)
-        except Exception as e:
-            print(f"Error calculating time diff: {e}")
-            init_days = init_hours = init_minutes = 0
-
         time_frame = tk.Frame(update_window)
         time_frame.pack(padx=10, pady=8, anchor="w", fill=tk.X)
         Label(time_frame, text="Update reset time:").pack(side=tk.LEFT)
         Label(time_frame, text="Days:").pack(side=tk.LEFT, padx=(8,0))
         days_entry = Entry(time_frame, width=5)
-        days_entry.insert(0, str(init_days))
         days_entry.pack(side=tk.LEFT, padx=2)
         Label(time_frame, text="Hours:").pack(side=tk.LEFT, padx=(8,0))
         hours_entry = Entry(time_frame, width=5)
-        hours_entry.insert(0, str(init_hours))
         hours_entry.pack(side=tk.LEFT, padx=2)
         Label(time_frame, text="Minutes:").pack(side=tk.LEFT, padx=(8,0))
         minutes_entry = Entry(time_frame, width=5)
-        minutes_entry.insert(0, str(init_minutes))
         minutes_entry.pack(side=tk.LEFT, padx=2)
 
         # Categories & override row (same layout as add)
@@ -688,9 +1064,8 @@ class VendorApp(tk.Tk):
         cat_frame = tk.Frame(cat_area_frame)
         cat_frame.pack(anchor="w", pady=2)
 
-        categories = ["Jewelry", "Armor", "Weapons", "Scrolls", "Misc"]
-        cat_vars = {c: BooleanVar(value=(c in vendor.categories)) for c in categories}
-        for i, c in enumerate(categories):
+        cat_vars = {c: IntVar() for c in CATEGORIES}
+        for i, c in enumerate(CATEGORIES):
             r, col = divmod(i, 3)
             cb = Checkbutton(cat_frame, text=c, variable=cat_vars[c])
             cb.grid(row=r, column=col, sticky="w", padx=8, pady=4)
@@ -703,98 +1078,128 @@ class VendorApp(tk.Tk):
         custom_entry = Entry(custom_wrap, width=18)
         custom_entry.pack(side=tk.LEFT, padx=4)
 
-        # If vendor has custom categories not in fixed list, prefill custom
-        custom_items = [c for c in vendor.categories if c not in categories]
-        if custom_items:
-            custom_var.set(True)
-            custom_entry.insert(0, ", ".join(custom_items))
-
         # Buttons
         button_line = tk.Frame(update_window)
         button_line.pack(padx=10, pady=10, fill=tk.X)
 
         def reset_now():
-            try:
-                if messagebox.askyesno("Confirm Reset", f"Are you sure you want to reset {vendor.name}?", parent=update_window):
-                    vendor.last_reset = datetime.now()
-                    if vendor.reset_maximum > 0:
-                        vendor.council_left = vendor.reset_maximum
-                    save_vendors(self.vendors, self.current_character)
-                    self.update_vendor_list()
-                    self.update_total_values()
-                    messagebox.showinfo("Success", f"Vendor '{vendor.name}' has been reset.", parent=update_window)
-                    update_window.destroy()
-            except Exception as e:
-                print(f"Error resetting vendor: {e}")
-                messagebox.showerror("Error", f"Could not reset vendor: {e}", parent=update_window)
+            vendor = update_window.vendor
+            if messagebox.askyesno("Confirm Reset", f"Are you sure you want to reset {vendor.name}?", parent=update_window):
+                vendor.last_reset = datetime.now()
+                self._reposition_vendor(vendor)
+                if vendor.reset_maximum > 0:
+                    vendor.council_left = vendor.reset_maximum
+                self._mark_dirty()
+                self._schedule_refresh()
+                self.set_status(f"Vendor '{vendor.name}' has been reset.")
+                update_window.withdraw()
 
         def update_vendor_action():
-            try:
-                try:
-                    council_input = float(council_entry.get() or 0)
-                    new_council = int(council_input * 1000)
-                except (ValueError, TypeError):
-                    messagebox.showerror("Error", "Council must be numeric (K).", parent=update_window)
-                    return
+            vendor = update_window.vendor
+            council_text = council_entry.get() or "0"
+            if not _DECIMAL_RE.fullmatch(council_text):
+                messagebox.showerror("Error", "Council must be numeric (K).", parent=update_window)
+                return
+            council_value = float(council_text) * 1000
+            if abs(council_value) > MAX_COUNCIL:
+                messagebox.showerror("Error", "Council value is too large.", parent=update_window)
+                return
+            new_council = int(council_value)
+
+            # Raw time inputs
+            time_texts = [e.get() or "0" for e in (days_entry, hours_entry, minutes_entry)]
+            if not all(_INTEGER_RE.fullmatch(t) for t in time_texts):
+                messagebox.showerror("Error", "Days/Hours/Minutes must be integers.", parent=update_window)
+                return
+            d_raw, h_raw, m_raw = map(int, time_texts)
+
+            override_flag = max_time_override_var.get()
+            total_minutes = d_raw * MINUTES_PER_DAY + h_raw * 60 + m_raw
+            if total_minutes > MAX_TOTAL_MINUTES and not override_flag:
+                messagebox.showerror("Error", "Reset time cannot exceed 6d 23h 59m unless Max-Time-Override is checked.", parent=update_window)
+                return
+
+            d, h, m = _clamp_reset_inputs(d_raw, h_raw, m_raw, override_flag)
+            vendor.council_left = new_council
+            vendor.reset_maximum = max(new_council, vendor.reset_maximum)
+            vendor.last_reset = calculate_last_reset(d, h, m, override_flag)
+            self._reposition_vendor(vendor)
+
+            get = IntVar.get  # unbound lookup hoisted out of the per-checkbox loop
+            selected_cats = (c for c, var in cat_vars.items() if get(var))
+            cv = custom_entry.get() if custom_var.get() else ""
+            extras = (x for x in (part.strip() for part in cv.split(",")) if x)
+
+            # Merge and dedupe (preserving order) in one pass
+            vendor.categories = list(dict.fromkeys(itertools.chain(selected_cats, extras)))
+            self._mark_dirty()
+            self._schedule_refresh()
+            self.set_status(f"Vendor '{vendor.name}' updated.")
+            update_window.withdraw()
 
-                # Raw time inputs
-                try:
-                    d_raw = int(days_entry.get() or 0)
-                    h_raw = int(hours_entry.get() or 0)
-                    m_raw = int(minutes_entry.get() or 0)
-                except (ValueError, TypeError):
-                    messagebox.showerror("Error", "Days/Hours/Minutes must be integers.", parent=update_window)
-                    return
+        reset_button = Button(button_line, text="Reset Now", command=reset_now, fg="red")
+        reset_button.pack(side=tk.LEFT, padx=6)
+        update_button = Button(button_line, text="Update", command=update_vendor_action)
+        update_button.pack(side=tk.RIGHT, padx=6)
 
-                override_flag = max_time_override_var.get()
-                total_minutes = d_raw * 24 * 60 + h_raw * 60 + m_raw
-                if total_minutes > MAX_TOTAL_MINUTES and not override_flag:
-                    messagebox.showerror("Error", "Reset time cannot exceed 6d 23h 59m unless Max-Time-Override is checked.", parent=update_window)
-                    return
+        # Kept on the window so _load_update_window can refill them for another vendor
+        update_window.council_entry = council_entry
+        update_window.time_entries = (days_entry, hours_entry, minutes_entry)
+        update_window.max_time_override_var = max_time_override_var
+        update_window.cat_vars = cat_vars
+        update_window.custom_var = custom_var
+        update_window.custom_entry = custom_entry
+        return update_window
+
+    def _load_update_window(self, vendor):
+        """Point the update dialog at vendor and prefill its fields."""
+        update_window = self._update_window
+        update_window.vendor = vendor
+        update_window.title(f"Update {vendor.name}")
+        update_window.header_label.config(text=f"Updating {vendor.name} ({vendor.zone})")
 
-                d, h, m = _clamp_reset_inputs(d_raw, h_raw, m_raw, override_flag)
-                vendor.council_left = new_council
-                if new_council > vendor.reset_maximum:
-                    vendor.reset_maximum = new_council
-                vendor.last_reset = calculate_last_reset(d, h, m, override_flag)
+        update_window.council_entry.delete(0, tk.END)
+        update_window.council_entry.insert(0, str(vendor.council_left // 1000))
 
-                selected_cats = [c for c, var in cat_vars.items() if var.get()]
-                if custom_var.get():
-                    cv = custom_entry.get().strip()
-                    if cv:
-                        extras = [x.strip() for x in cv.split(",") if x.strip()]
-                        selected_cats.extend(extras)
+        # Prefill time until next reset
+        try:
+            time_diff = vendor.next_reset - datetime.now()
+            init_days = max(0, time_diff.days)
+            init_hours = max(0, time_diff.seconds // 3600)
+            init_minutes = max(0, (time_diff.seconds % 3600) // 60)
+        except Exception:
+            logger.exception("Error calculating time diff")
+            init_days = init_hours = init_minutes = 0
+        for entry, value in zip(update_window.time_entries, (init_days, init_hours, init_minutes)):
+            entry.delete(0, tk.END)
+            entry.insert(0, str(value))
 
-                # Dedupe preserve order
-                seen = set()
-                final_cats = []
-                for c in selected_cats:
-                    if c not in seen:
-                        seen.add(c)
-                        final_cats.append(c)
-
-                vendor.categories = final_cats
-                save_vendors(self.vendors, self.current_character)
-                self.update_vendor_list()
-                self.update_total_values()
-                messagebox.showinfo("Success", f"Vendor '{vendor.name}' updated.", parent=update_window)
-                update_window.destroy()
-            except Exception as e:
-                print(f"Error updating vendor: {e}")
-                messagebox.showerror("Error", f"Could not update vendor: {e}", parent=update_window)
+        update_window.max_time_override_var.set(False)
+        vendor_cats_set = set(vendor.categories)
+        for c, var in update_window.cat_vars.items():
+            var.set(int(c in vendor_cats_set))
 
-        reset_button = Button(button_line, text="Reset Now", command=reset_now, fg="red")
-        reset_button.pack(side=tk.LEFT, padx=6)
-        update_button = Button(button_line, text="Update", command=update_vendor_action)
-        update_button.pack(side=tk.RIGHT, padx=6)
+        # If vendor has custom categories not in fixed list, prefill custom
+        custom_items = [c for c in vendor.categories if c not in _CATEGORY_SET]
+        update_window.custom_var.set(bool(custom_items))
+        update_window.custom_entry.delete(0, tk.END)
+        if custom_items:
+            update_window.custom_entry.insert(0, ", ".join(custom_items))
 
     def on_closing(self):
         """Handle application closing."""
         try:
             self.timer_running = False
-            save_vendors(self.vendors, self.current_character)
-        except Exception as e:
-            print(f"Error saving on close: {e}")
+            # Final write goes behind any queued ones. Wait a bounded time so a slow disk
+            # can't keep the window open; _save_at_exit waits for the rest before exit.
+            self._report_save_errors()
+            self._save_dirty = False
+            self._queue_save()
+            self._save_queue.put(None)
+            self._saver.join(SHUTDOWN_SAVE_TIMEOUT)
+            self._report_save_errors()
+        except Exception:
+            logger.exception("Error saving on close")
         finally:
             self.destroy()
 
@@ -802,13 +1207,19 @@ class VendorApp(tk.Tk):
 # Launch
 # ---------------------
 if __name__ == "__main__":
+    log_format = "%(asctime)s %(levelname)s %(message)s"
+    try:
+        logging.basicConfig(level=logging.WARNING, filename=LOG_FILE, format=log_format)
+    except OSError:
+        # Script folder not writable (e.g. under Program Files): log to stderr rather than fail to start
+        logging.basicConfig(level=logging.WARNING, format=log_format)
     try:
         app = VendorApp()
         # Ensure saving on close
         app.protocol("WM_DELETE_WINDOW", app.on_closing)
         app.mainloop()
-    except Exception as e:
-        print(f"Fatal error: {e}")
+    except Exception:
+        logger.exception("Fatal error")
         if 'app' in locals():
             try:
                 app.destroy()